@@ -3,22 +3,76 @@
 # Unified data generator for MongoMasterPro with lite/full modes
 
 import argparse
+import bisect
 import hashlib
 import json
+import multiprocessing
 import os
 import random
-import uuid
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import accumulate
 
+import bson
+import numpy as np
 from bson.objectid import ObjectId
 from faker import Faker
-
-fake = Faker()
+from faker.providers.date_time import Provider as DateTimeProvider
+
+# Optional fast JSON encoders: orjson serializes datetimes natively in C,
+# ujson is the fallback, and the stdlib encoder is used if neither exists
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# Uniform element selection: the generated data never relies on Faker's
+# real-world frequency weighting, and the weighted path is far slower.
+fake = Faker(use_weighting=False)
+
+# Every timezone name Faker's timezone() can return, deduplicated in order
+TIMEZONES = tuple(dict.fromkeys(
+    tz for country in DateTimeProvider.countries for tz in country.timezones
+))
+
+# Seconds per unit for Faker-style relative date specs such as '-30d'.
+# Matches Faker's timedelta_pattern: 'M' is months and 'm' is minutes.
+DATE_UNIT_SECONDS = {
+    'y': 365.24 * 86400,
+    'M': 30.42 * 86400,
+    'w': 7 * 86400,
+    'd': 86400,
+    'h': 3600,
+    'm': 60,
+    's': 1
+}
+DATE_SPEC_PATTERN = re.compile(r'([+-]?)(\d+)([ymwdhMs])')
+
+# Reference fields holding ObjectId hex strings, stored as real ObjectIds
+# when writing BSON
+OBJECT_ID_FIELDS = ('_id', 'user_id', 'course_id', 'instructor_id', 'parent_id')
+
+# Database the BSON dump is laid out for (matches the mongoimport target)
+BSON_DATABASE = 'learning_platform'
 
 
 class MongoDataGenerator:
-    def __init__(self, mode='lite'):
+    def __init__(self, mode='lite', seed=None, output_format='json'):
         self.mode = mode
+        self.seed = seed
+        # Instance-bound RNG: cheaper than the random module's globals and
+        # reseeded per stage by run_stage() for reproducible datasets
+        self.rng = random.Random(seed)
+        # NumPy Generator for whole-column draws, reseeded alongside self.rng
+        self.np_rng = np.random.default_rng(seed)
+        self.output_format = output_format
         self.schemas = self.load_schemas()
 
         # Data volume configuration
@@ -43,6 +97,24 @@ class MongoDataGenerator:
                 'analytics_events': 100000
             }
 
+        # Cumulative weights for the weighted picks in the generator loops,
+        # resolved with bisect against rng.random()
+        self._user_status_cum = self.cumulative_weights([0.85, 0.1, 0.05])
+        self._course_status_cum = self.cumulative_weights([0.1, 0.85, 0.05])
+        self._completion_cum = self.cumulative_weights([0.1, 0.4, 0.3, 0.2])
+        self._event_cum = self.cumulative_weights([
+            0.15, 0.1, 0.25, 0.08, 0.12, 0.08,
+            0.1, 0.05, 0.03, 0.02, 0.01, 0.01
+        ])
+        self._completed_rating_cum = self.cumulative_weights([0.1, 0.3, 0.6])
+        self._in_progress_rating_cum = self.cumulative_weights(
+            [0.1, 0.2, 0.4, 0.3]
+        )
+
+        # Every seeded account shares a fixed password, so hash each once
+        self._user_password_hash = self.hash_password("password123")
+        self._instructor_password_hash = self.hash_password("instructor123")
+
         print(f"🎯 Initializing MongoMasterPro Data Generator ({mode} mode)")
         print(f"📊 Target volumes: {self.config}")
 
@@ -75,9 +147,85 @@ class MongoDataGenerator:
             ]
         }
 
-    def generate_object_id(self):
-        """Generate MongoDB ObjectId as string"""
-        return str(ObjectId())
+    def cumulative_weights(self, weights):
+        """Normalize weights into a cumulative table ending exactly at 1.0"""
+        total = sum(weights)
+        cum = [w / total for w in accumulate(weights)]
+        cum[-1] = 1.0
+        return cum
+
+    def relative_timestamp(self, spec, now_ts):
+        """Resolve a date spec ('now', '-2y', '-30d') to a Unix timestamp"""
+        if spec == 'now':
+            return now_ts
+        match = DATE_SPEC_PATTERN.fullmatch(spec)
+        if match is None:
+            raise ValueError(f"Unsupported date spec: {spec!r}")
+        sign, amount, unit = match.groups()
+        offset = int(int(amount) * DATE_UNIT_SECONDS[unit])
+        return now_ts - offset if sign == '-' else now_ts + offset
+
+    def random_timestamps(self, start_date, end_date, size):
+        """Draw `size` Unix timestamps uniformly between two date specs"""
+        now_ts = int(time.time())
+        low = self.relative_timestamp(start_date, now_ts)
+        high = self.relative_timestamp(end_date, now_ts)
+        return self.scaled_timestamps(low, high + 1, size)
+
+    def random_timestamps_since(self, starts):
+        """Draw one Unix timestamp between each start timestamp and now"""
+        return self.scaled_timestamps(starts, int(time.time()) + 1, len(starts))
+
+    def scaled_timestamps(self, low, high, size):
+        """Draw size timestamps in [low, high) from a fixed slice of np_rng
+
+        integers() rejection-samples, so how much of the stream it consumes
+        depends on the bounds. The bounds move with the wall clock here, and
+        scaling uniform floats keeps later draws reproducible for a seed.
+        """
+        spans = np.subtract(high, low, dtype=np.int64)
+        return low + (self.np_rng.random(size) * spans).astype(np.int64)
+
+    def format_timestamps(self, timestamps):
+        """Convert Unix timestamps to output date values in one NumPy pass
+
+        JSON gets ISO 8601 strings and BSON gets naive UTC datetimes, so no
+        per-record datetime is built just to be re-serialized.
+        """
+        dates = np.asarray(timestamps, dtype='datetime64[s]')
+        if self.output_format == 'bson':
+            return dates.tolist()
+        return dates.astype(str).tolist()
+
+    def batch_sentences(self, count, nb_words):
+        """Build count sentences of nb_words words from one fake.words() call"""
+        words = fake.words(nb=count * nb_words)
+        return [
+            " ".join(words[i:i + nb_words]).capitalize() + "."
+            for i in range(0, count * nb_words, nb_words)
+        ]
+
+    def batch_object_ids(self, n):
+        """Generate n MongoDB ObjectId hex strings in one batch
+
+        Follows the ObjectId layout (4-byte timestamp, 5 random bytes,
+        3-byte counter) without constructing an ObjectId per record.
+        """
+        prefix = (int(time.time()).to_bytes(4, 'big') + os.urandom(5)).hex()
+        counter = int.from_bytes(os.urandom(3), 'big')
+        return [f"{prefix}{(counter + i) & 0xFFFFFF:06x}" for i in range(n)]
+
+    def batch_uuids(self, n):
+        """Generate n random (version 4) UUID strings from one urandom read"""
+        raw = os.urandom(16 * n).hex()
+        uuids = []
+        for i in range(0, 32 * n, 32):
+            h = raw[i:i + 32]
+            variant = "89ab"[int(h[16], 16) & 3]
+            uuids.append(
+                f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:]}"
+            )
+        return uuids
 
     def hash_password(self, password):
         """Generate bcrypt-style password hash"""
@@ -88,38 +236,54 @@ class MongoDataGenerator:
         print(f"👥 Generating {self.config['users']} users...")
         users = []
 
-        for i in range(self.config['users']):
-            profile = fake.profile()
+        # Bind hot callables and schema lookups once for the whole loop
+        _choice = self.rng.choice
+        _bisect = bisect.bisect
+        _random = self.rng.random
+        difficulty_levels = self.schemas['difficulty_levels']
+        user_statuses = self.schemas['user_statuses']
+        user_status_cum = self._user_status_cum
+        languages = ("en", "es", "fr", "de", "ja")
+        booleans = (True, False)
+
+        n = self.config['users']
+        ids = self.batch_object_ids(n)
+        # Lorem text dominates per-user cost and is never queried by value
+        bios = [fake.text(max_nb_chars=200) for _ in range(min(n, 1000))]
+        created = self.format_timestamps(self.random_timestamps('-2y', 'now', n))
+        updated = self.format_timestamps(self.random_timestamps('-30d', 'now', n))
+
+        for i in range(n):
+            # Only a handful of fields are needed; fake.profile() would
+            # build a dozen more (SSN, job, residence, ...) and discard them
+            username = fake.user_name()
             user = {
-                "_id": self.generate_object_id(),
-                "email": profile['mail'],
-                "username": profile['username'],
-                "password_hash": self.hash_password("password123"),
+                "_id": ids[i],
+                "email": fake.email(),
+                "username": username,
+                "password_hash": self._user_password_hash,
                 "profile": {
-                    "first_name": profile['name'].split()[0],
-                    "last_name": profile['name'].split()[-1],
-                    "bio": fake.text(max_nb_chars=200),
+                    "first_name": fake.first_name(),
+                    "last_name": fake.last_name(),
+                    "bio": _choice(bios),
                     "avatar_url": (
                         f"https://api.dicebear.com/7.x/avataaars/svg?"
-                        f"seed={profile['username']}"
+                        f"seed={username}"
                     ),
                     "social_links": [
-                        f"https://linkedin.com/in/{profile['username']}",
-                        f"https://github.com/{profile['username']}"
+                        f"https://linkedin.com/in/{username}",
+                        f"https://github.com/{username}"
                     ]
                 },
                 "preferences": {
-                    "language": random.choice(["en", "es", "fr", "de", "ja"]),
-                    "timezone": str(fake.timezone()),
-                    "email_notifications": random.choice([True, False]),
-                    "difficulty_level": random.choice(self.schemas['difficulty_levels'])
+                    "language": _choice(languages),
+                    "timezone": _choice(TIMEZONES),
+                    "email_notifications": _choice(booleans),
+                    "difficulty_level": _choice(difficulty_levels)
                 },
-                "status": random.choices(
-                    self.schemas['user_statuses'],
-                    weights=[0.85, 0.1, 0.05]
-                )[0],
-                "created_at": fake.date_time_between(start_date='-2y', end_date='now'),
-                "updated_at": fake.date_time_between(start_date='-30d', end_date='now')
+                "status": user_statuses[_bisect(user_status_cum, _random())],
+                "created_at": created[i],
+                "updated_at": updated[i]
             }
             users.append(user)
 
@@ -130,18 +294,30 @@ class MongoDataGenerator:
         print(f"👨‍🏫 Generating {self.config['instructors']} instructors...")
         instructors = []
 
-        for i in range(self.config['instructors']):
+        _choice = self.rng.choice
+        _randint = self.rng.randint
+        _sample = self.rng.sample
+        categories_list = self.schemas['categories']
+
+        n = self.config['instructors']
+        ids = self.batch_object_ids(n)
+        created = self.format_timestamps(self.random_timestamps('-3y', '-1y', n))
+        bio_years = self.np_rng.integers(3, 16, n).tolist()
+        experience_years = self.np_rng.integers(3, 16, n).tolist()
+        updated = self.format_timestamps(self.random_timestamps('-7d', 'now', n))
+
+        for i in range(n):
             instructor = {
-                "_id": self.generate_object_id(),
+                "_id": ids[i],
                 "email": fake.email(),
                 "username": fake.user_name(),
-                "password_hash": self.hash_password("instructor123"),
+                "password_hash": self._instructor_password_hash,
                 "profile": {
                     "first_name": fake.first_name(),
                     "last_name": fake.last_name(),
                     "bio": (
-                        f"Expert {random.choice(self.schemas['categories'])} instructor "
-                        f"with {random.randint(3, 15)}+ years experience"
+                        f"Expert {_choice(categories_list)} instructor "
+                        f"with {bio_years[i]}+ years experience"
                     ),
                     "avatar_url": (
                         f"https://api.dicebear.com/7.x/avataaars/svg?"
@@ -154,24 +330,21 @@ class MongoDataGenerator:
                     "certifications": [
                         (
                             f"Certified "
-                            f"{random.choice(self.schemas['categories'])} Professional"
+                            f"{_choice(categories_list)} Professional"
                         ),
                         (
-                            f"Advanced {random.choice(self.schemas['categories'])} "
+                            f"Advanced {_choice(categories_list)} "
                             f"Specialist"
                         )
                     ],
-                    "experience_years": random.randint(3, 15),
+                    "experience_years": experience_years[i],
                     "specializations": (
-                        random.sample(
-                            self.schemas['categories'],
-                            k=random.randint(2, 4)
-                        )
+                        _sample(categories_list, k=_randint(2, 4))
                     )
                 },
                 "preferences": {
                     "language": "en",
-                    "timezone": str(fake.timezone()),
+                    "timezone": _choice(TIMEZONES),
                     "email_notifications": True,
                     "difficulty_level": "advanced"
                 },
@@ -182,8 +355,8 @@ class MongoDataGenerator:
                     "total_revenue": 0.0
                 },
                 "status": "active",
-                "created_at": fake.date_time_between(start_date='-3y', end_date='-1y'),
-                "updated_at": fake.date_time_between(start_date='-7d', end_date='now')
+                "created_at": created[i],
+                "updated_at": updated[i]
             }
             instructors.append(instructor)
 
@@ -196,30 +369,34 @@ class MongoDataGenerator:
 
         # Main categories
         main_categories = self.schemas['categories'][:self.config['categories']//2]
+        subcategory_count = self.config['categories'] - len(main_categories)
 
-        for cat in main_categories:
+        _dates = self.format_timestamps
+        _timestamps = self.random_timestamps
+        main_created = _dates(_timestamps('-1y', 'now', len(main_categories)))
+        sub_created = _dates(_timestamps('-6M', 'now', subcategory_count))
+        updated = _dates(_timestamps('-30d', 'now', self.config['categories']))
+        ids = self.batch_object_ids(self.config['categories'])
+
+        for i, cat in enumerate(main_categories):
             category = {
-                "_id": self.generate_object_id(),
+                "_id": ids[i],
                 "name": cat,
                 "description": f"Comprehensive courses and tutorials about {cat}",
                 "parent_id": None,
                 "level": 0,
                 "course_count": 0,
                 "status": "active",
-                "created_at": (
-                    fake.date_time_between(start_date='-1y', end_date='now')
-                ),
-                "updated_at": (
-                    fake.date_time_between(start_date='-30d', end_date='now')
-                )
+                "created_at": main_created[i],
+                "updated_at": updated[i]
             }
             categories.append(category)
 
         # Subcategories
-        for i in range(self.config['categories'] - len(main_categories)):
-            parent = random.choice(categories)
+        for i in range(subcategory_count):
+            parent = self.rng.choice(categories)
             subcategory = {
-                "_id": self.generate_object_id(),
+                "_id": ids[len(main_categories) + i],
                 "name": f"{parent['name']} - {fake.word().title()}",
                 "description": (
                     f"Specialized {parent['name'].lower()} topics and "
@@ -229,12 +406,8 @@ class MongoDataGenerator:
                 "level": 1,
                 "course_count": 0,
                 "status": "active",
-                "created_at": (
-                    fake.date_time_between(start_date='-6m', end_date='now')
-                ),
-                "updated_at": (
-                    fake.date_time_between(start_date='-30d', end_date='now')
-                )
+                "created_at": sub_created[i],
+                "updated_at": updated[len(main_categories) + i]
             }
             categories.append(subcategory)
 
@@ -245,48 +418,75 @@ class MongoDataGenerator:
         print(f"📚 Generating {self.config['courses']} courses...")
         courses = []
 
-        for i in range(self.config['courses']):
-            category = random.choice(categories)
-            instructor = random.choice(instructors)
-
-            course_titles = [
-                f"Complete {category['name']} Bootcamp",
-                f"Master {category['name']} from Scratch",
-                f"Advanced {category['name']} Techniques",
-                f"Professional {category['name']} Development",
-                f"{category['name']} for Beginners",
-                f"Modern {category['name']} Best Practices"
-            ]
+        _choice = self.rng.choice
+        _bisect = bisect.bisect
+        _random = self.rng.random
+        _randint = self.rng.randint
+        _sample = self.rng.sample
+        _sentences = self.batch_sentences
+        difficulty_levels = self.schemas['difficulty_levels']
+        course_statuses = self.schemas['course_statuses']
+        course_status_cum = self._course_status_cum
+
+        # Titles and tag pools only depend on the category name, so build
+        # them once per category rather than once per course
+        course_titles = {}
+        course_tags = {}
+
+        n = self.config['courses']
+        ids = self.batch_object_ids(n)
+        created = self.format_timestamps(self.random_timestamps('-1y', 'now', n))
+        updated = self.format_timestamps(self.random_timestamps('-30d', 'now', n))
+        durations = np.round(self.np_rng.uniform(5.0, 40.0, n), 1).tolist()
+        prices = np.round(self.np_rng.uniform(29.99, 299.99, n), 2).tolist()
+
+        # Descriptions are never looked up by value, so sample them from a
+        # pre-generated pool instead of calling fake.text() per course
+        descriptions = [fake.text(max_nb_chars=800) for _ in range(min(n, 200))]
+
+        for i in range(n):
+            category = _choice(categories)
+            instructor = _choice(instructors)
+            category_name = category['name']
+
+            if category_name not in course_titles:
+                course_titles[category_name] = (
+                    f"Complete {category_name} Bootcamp",
+                    f"Master {category_name} from Scratch",
+                    f"Advanced {category_name} Techniques",
+                    f"Professional {category_name} Development",
+                    f"{category_name} for Beginners",
+                    f"Modern {category_name} Best Practices"
+                )
+                course_tags[category_name] = (
+                    category_name.lower(), "tutorial", "hands-on",
+                    "project-based", "beginner-friendly", "advanced",
+                    "certification", "practical"
+                )
 
             course = {
-                "_id": self.generate_object_id(),
-                "title": random.choice(course_titles),
-                "description": fake.text(max_nb_chars=800),
+                "_id": ids[i],
+                "title": _choice(course_titles[category_name]),
+                "description": _choice(descriptions),
                 "instructor_id": instructor['_id'],
-                "category": category['name'],
-                "tags": random.sample([
-                    category['name'].lower(), "tutorial", "hands-on",
-                    "project-based", "beginner-friendly", "advanced",
-                    "certification", "practical"
-                ], k=random.randint(3, 6)),
-                "difficulty_level": (
-                    random.choice(self.schemas['difficulty_levels'])
-                ),
-                "duration_hours": round(random.uniform(5.0, 40.0), 1),
-                "price": round(random.uniform(29.99, 299.99), 2),
+                "category": category_name,
+                "tags": _sample(course_tags[category_name], k=_randint(3, 6)),
+                "difficulty_level": _choice(difficulty_levels),
+                "duration_hours": durations[i],
+                "price": prices[i],
                 "currency": "USD",
                 "content": {
                     "modules": [
-                        f"Module {j+1}: {fake.sentence(nb_words=4)}"
-                        for j in range(random.randint(5, 12))
+                        f"Module {j+1}: {sentence}"
+                        for j, sentence in enumerate(_sentences(_randint(5, 12), 4))
                     ],
                     "resources": [
                         "Video Lectures", "Interactive Exercises", "Code Examples",
                         "Reference Materials", "Community Access"
                     ],
                     "assignments": [
-                        f"Project {j+1}: {fake.sentence(nb_words=6)}"
-                        for j in range(random.randint(2, 5))
+                        f"Project {j+1}: {sentence}"
+                        for j, sentence in enumerate(_sentences(_randint(2, 5), 6))
                     ]
                 },
                 "enrollment_count": 0,
@@ -294,16 +494,9 @@ class MongoDataGenerator:
                     "average": 0.0,
                     "count": 0
                 },
-                "status": random.choices(
-                    self.schemas['course_statuses'],
-                    weights=[0.1, 0.85, 0.05]
-                )[0],
-                "created_at": (
-                    fake.date_time_between(start_date='-1y', end_date='now')
-                ),
-                "updated_at": (
-                    fake.date_time_between(start_date='-30d', end_date='now')
-                )
+                "status": course_statuses[_bisect(course_status_cum, _random())],
+                "created_at": created[i],
+                "updated_at": updated[i]
             }
             courses.append(course)
 
@@ -313,182 +506,241 @@ class MongoDataGenerator:
         """Generate enrollment data"""
         print(f"📝 Generating {self.config['enrollments']} enrollments...")
         enrollments = []
-        used_combinations = set()
-
-        for i in range(self.config['enrollments']):
-            while True:
-                user = random.choice(users)
-                course = random.choice(courses)
-                combo = (user['_id'], course['_id'])
-                if combo not in used_combinations:
-                    used_combinations.add(combo)
-                    break
-
-            enrolled_date = fake.date_time_between(start_date='-6m', end_date='now')
-            completion_status = random.choices(
-                self.schemas['completion_statuses'],
-                weights=[0.1, 0.4, 0.3, 0.2]
-            )[0]
+
+        _bisect = bisect.bisect
+        _random = self.rng.random
+        completion_statuses = self.schemas['completion_statuses']
+        completion_cum = self._completion_cum
+        _randint = self.rng.randint
+
+        # Draw distinct (user, course) pairs as flat indices in one pass
+        # instead of rejecting duplicates
+        course_count = len(courses)
+        n = min(self.config['enrollments'], len(users) * course_count)
+        pairs = self.np_rng.choice(
+            len(users) * course_count, size=n, replace=False
+        )
+        user_idx, course_idx = np.divmod(pairs, course_count)
+        user_idx = user_idx.tolist()
+        course_idx = course_idx.tolist()
+
+        ids = self.batch_object_ids(n)
+        current_modules = self.np_rng.integers(1, 9, n).tolist()
+        enrolled = self.random_timestamps('-6M', 'now', n)
+        enrolled_at = self.format_timestamps(enrolled)
+        last_accessed = self.format_timestamps(self.random_timestamps_since(enrolled))
+        completed_at = self.format_timestamps(self.random_timestamps_since(enrolled))
+        updated = self.format_timestamps(self.random_timestamps_since(enrolled))
+
+        # Records start as a copy of this template (key order included) so
+        # only the per-row fields are assigned; completion fields keep their
+        # defaults unless the enrollment is completed
+        template = {
+            "_id": None,
+            "user_id": None,
+            "course_id": None,
+            "progress": None,
+            "completion_status": None,
+            "completion_date": None,
+            "certificate_issued": False,
+            "enrolled_at": None,
+            "updated_at": None
+        }
+        _new_enrollment = template.copy
+
+        for i in range(n):
+            user = users[user_idx[i]]
+            course = courses[course_idx[i]]
+            completion_status = completion_statuses[
+                _bisect(completion_cum, _random())
+            ]
 
             progress_percentage = 0
             if completion_status == "in_progress":
-                progress_percentage = random.randint(10, 90)
+                progress_percentage = _randint(10, 90)
             elif completion_status == "completed":
                 progress_percentage = 100
             elif completion_status == "dropped":
-                progress_percentage = random.randint(5, 50)
-
-            enrollment = {
-                "_id": self.generate_object_id(),
-                "user_id": user['_id'],
-                "course_id": course['_id'],
-                "progress": {
-                    "percentage": progress_percentage,
-                    "completed_modules": (
-                        random.randint(0, progress_percentage // 10)
-                    ),
-                    "current_module": f"Module {random.randint(1, 8)}",
-                    "last_accessed": (
-                        fake.date_time_between(
-                            start_date=enrolled_date,
-                            end_date='now'
-                        )
-                    )
-                },
-                "completion_status": completion_status,
-                "completion_date": (
-                    fake.date_time_between(
-                        start_date=enrolled_date,
-                        end_date='now'
-                    ) if completion_status == "completed" else None
-                ),
-                "certificate_issued": (
-                    completion_status == "completed" and
-                    random.choice([True, False])
-                ),
-                "enrolled_at": enrolled_date,
-                "updated_at": (
-                    fake.date_time_between(
-                        start_date=enrolled_date,
-                        end_date='now'
-                    )
-                )
+                progress_percentage = _randint(5, 50)
+
+            enrollment = _new_enrollment()
+            enrollment["_id"] = ids[i]
+            enrollment["user_id"] = user['_id']
+            enrollment["course_id"] = course['_id']
+            enrollment["progress"] = {
+                "percentage": progress_percentage,
+                "completed_modules": _randint(0, progress_percentage // 10),
+                "current_module": f"Module {current_modules[i]}",
+                "last_accessed": last_accessed[i]
             }
+            enrollment["completion_status"] = completion_status
+            if completion_status == "completed":
+                enrollment["completion_date"] = completed_at[i]
+                enrollment["certificate_issued"] = _random() < 0.5
+            enrollment["enrolled_at"] = enrolled_at[i]
+            enrollment["updated_at"] = updated[i]
             enrollments.append(enrollment)
 
         return enrollments
 
     def generate_reviews(self, enrollments):
-        """Generate course reviews"""
+        """Generate course reviews, yielding one record at a time"""
         print(f"⭐ Generating {self.config['reviews']} reviews...")
-        reviews = []
 
-        # Only create reviews for completed or in-progress enrollments
-        eligible_enrollments = [
-            e for e in enrollments
-            if e['completion_status'] in ['completed', 'in_progress']
-        ]
+        # Only create reviews for completed or in-progress enrollments; keep
+        # their positions rather than copying the records into a new list
+        eligible_statuses = frozenset({'completed', 'in_progress'})
+        eligible_idx = np.fromiter(
+            (
+                i for i, e in enumerate(enrollments)
+                if e['completion_status'] in eligible_statuses
+            ),
+            dtype=np.int64
+        )
 
-        for i in range(
-            min(self.config['reviews'], len(eligible_enrollments))
-        ):
-            enrollment = random.choice(eligible_enrollments)
+        n = min(self.config['reviews'], len(eligible_idx))
+        if n == 0:
+            return
+
+        _choice = self.rng.choice
+        np_rng = self.np_rng
+        ids = self.batch_object_ids(n)
+        helpful_votes = np_rng.integers(0, 51, n).tolist()
+        updated = self.format_timestamps(self.random_timestamps('-7d', 'now', n))
+
+        # Review text is sampled from pools, like course descriptions; lorem
+        # generation was the bulk of the remaining per-review cost
+        pool_size = min(n, 1000)
+        titles = self.batch_sentences(pool_size, 6)
+        comments = [fake.text(max_nb_chars=400) for _ in range(pool_size)]
+
+        # Pick the reviewed enrollments up front so every created_at can be
+        # drawn after its enrollment date in one batch
+        pick = np_rng.integers(0, len(eligible_idx), n)
+        picked = [enrollments[j] for j in eligible_idx[pick].tolist()]
+        enrolled = np.array(
+            [e['enrolled_at'] for e in picked], dtype='datetime64[s]'
+        ).astype(np.int64)
+        created = self.format_timestamps(self.random_timestamps_since(enrolled))
+
+        # Higher ratings for completed courses; both distributions are drawn
+        # for every review and the enrollment status selects one
+        completed_ratings = np.array([3, 4, 5])[np.searchsorted(
+            self._completed_rating_cum, np_rng.random(n), side='right'
+        )]
+        in_progress_ratings = np.array([2, 3, 4, 5])[np.searchsorted(
+            self._in_progress_rating_cum, np_rng.random(n), side='right'
+        )]
+        is_completed = np.array(
+            [e['completion_status'] == 'completed' for e in picked]
+        )
+        ratings = np.where(
+            is_completed, completed_ratings, in_progress_ratings
+        ).tolist()
 
-            # Higher ratings for completed courses
-            if enrollment['completion_status'] == 'completed':
-                rating = (
-                    random.choices([3, 4, 5], weights=[0.1, 0.3, 0.6])[0]
-                )
-            else:
-                rating = (
-                    random.choices(
-                        [2, 3, 4, 5],
-                        weights=[0.1, 0.2, 0.4, 0.3]
-                    )[0]
-                )
+        for i in range(n):
+            enrollment = picked[i]
 
             review = {
-                "_id": self.generate_object_id(),
+                "_id": ids[i],
                 "user_id": enrollment['user_id'],
                 "course_id": enrollment['course_id'],
-                "rating": rating,
-                "title": fake.sentence(nb_words=6),
-                "comment": fake.text(max_nb_chars=400),
-                "helpful_votes": random.randint(0, 50),
+                "rating": ratings[i],
+                "title": _choice(titles),
+                "comment": _choice(comments),
+                "helpful_votes": helpful_votes[i],
                 "verified_purchase": True,
-                "created_at": (
-                    fake.date_time_between(
-                        start_date=enrollment['enrolled_at'],
-                        end_date='now'
-                    )
-                ),
-                "updated_at": (
-                    fake.date_time_between(start_date='-7d', end_date='now')
-                )
+                "created_at": created[i],
+                "updated_at": updated[i]
             }
-            reviews.append(review)
-
-        return reviews
+            yield review
 
     def generate_analytics_events(self, users, courses):
-        """Generate analytics tracking events"""
+        """Generate analytics tracking events, yielding one record at a time"""
         print(f"📊 Generating {self.config['analytics_events']} analytics events...")
-        events = []
-
-        for i in range(self.config['analytics_events']):
-            user = random.choice(users)
-            event_type = random.choices(
-                self.schemas['event_types'],
-                weights=[
-                    0.15, 0.1, 0.25, 0.08, 0.12, 0.08,
-                    0.1, 0.05, 0.03, 0.02, 0.01, 0.01
-                ]
-            )[0]
-
-            event = {
-                "_id": self.generate_object_id(),
-                "user_id": user['_id'],
-                "event_type": event_type,
-                "course_id": (
-                    random.choice(courses)['_id']
-                    if event_type in [
-                        'course_view', 'enrollment', 'completion',
-                        'video_play', 'quiz_attempt', 'assignment_submit'
-                    ]
-                    else None
-                ),
-                "session_id": str(uuid.uuid4()),
-                "properties": {
-                    "user_agent": fake.user_agent(),
-                    "ip_address": fake.ipv4(),
-                    "duration_seconds": (
-                        random.randint(30, 3600)
-                        if event_type in [
-                            'course_view', 'video_play', 'quiz_attempt'
-                        ]
-                        else None
-                    )
-                },
-                "timestamp": (
-                    fake.date_time_between(start_date='-3m', end_date='now')
-                )
-            }
-            events.append(event)
+        event_types = self.schemas['event_types']
+        course_event_types = {
+            'course_view', 'enrollment', 'completion',
+            'video_play', 'quiz_attempt', 'assignment_submit'
+        }
+        timed_event_types = {'course_view', 'video_play', 'quiz_attempt'}
 
-        return events
+        n = self.config['analytics_events']
+        ids = self.batch_object_ids(n)
+        session_ids = self.batch_uuids(n)
+        timestamps = self.format_timestamps(self.random_timestamps('-3M', 'now', n))
 
-    def save_data(self, data, filename):
-        """Save generated data to JSON file"""
-        # Get the directory where the script is running from
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        generated_dir = os.path.join(
-            os.path.dirname(script_dir),
-            'generated'
+        # Build every column with one NumPy draw, then zip rows together
+        np_rng = self.np_rng
+        event_idx = np.searchsorted(
+            self._event_cum, np_rng.random(n), side='right'
         )
-
-        # Ensure generated directory exists
-        os.makedirs(generated_dir, exist_ok=True)
-        output_file = os.path.join(generated_dir, filename)
+        has_course = np.isin(event_idx, [
+            i for i, t in enumerate(event_types) if t in course_event_types
+        ])
+        is_timed = np.isin(event_idx, [
+            i for i, t in enumerate(event_types) if t in timed_event_types
+        ])
+
+        user_ids = np.array([u['_id'] for u in users])
+        course_ids = np.array([c['_id'] for c in courses])
+        user_col = user_ids[np_rng.integers(0, len(users), n)].tolist()
+        course_col = course_ids[np_rng.integers(0, len(courses), n)].tolist()
+        duration_col = np_rng.integers(30, 3601, n).tolist()
+
+        # fake.user_agent() and fake.ipv4() are among Faker's slowest
+        # providers; pooled devices and addresses are also more realistic,
+        # since real sessions repeat them across events
+        user_agents = [fake.user_agent() for _ in range(100)]
+        ip_addresses = [fake.ipv4() for _ in range(min(n, 10000))]
+        ua_col = np_rng.integers(0, len(user_agents), n).tolist()
+        ip_col = np_rng.integers(0, len(ip_addresses), n).tolist()
+
+        event_col = [event_types[i] for i in event_idx.tolist()]
+        has_course = has_course.tolist()
+        is_timed = is_timed.tolist()
+
+        # Events start as a copy of these templates (key order included);
+        # course_id and duration_seconds stay None unless the type uses them
+        template = {
+            "_id": None,
+            "user_id": None,
+            "event_type": None,
+            "course_id": None,
+            "session_id": None,
+            "properties": None,
+            "timestamp": None
+        }
+        properties_template = {
+            "user_agent": None,
+            "ip_address": None,
+            "duration_seconds": None
+        }
+        _new_event = template.copy
+        _new_properties = properties_template.copy
+
+        for i in range(n):
+            properties = _new_properties()
+            properties["user_agent"] = user_agents[ua_col[i]]
+            properties["ip_address"] = ip_addresses[ip_col[i]]
+            if is_timed[i]:
+                properties["duration_seconds"] = duration_col[i]
+
+            event = _new_event()
+            event["_id"] = ids[i]
+            event["user_id"] = user_col[i]
+            event["event_type"] = event_col[i]
+            if has_course[i]:
+                event["course_id"] = course_col[i]
+            event["session_id"] = session_ids[i]
+            event["properties"] = properties
+            event["timestamp"] = timestamps[i]
+            yield event
+
+    def record_encoder(self):
+        """Return the fastest available record -> JSON bytes encoder"""
+        if orjson is not None:
+            return orjson.dumps
 
         # Convert datetime objects to ISO format
         def json_serializer(obj):
@@ -498,41 +750,151 @@ class MongoDataGenerator:
                 f"Object of type {type(obj)} is not JSON serializable"
             )
 
-        with open(output_file, 'w') as f:
-            json.dump(
-                data,
-                f,
-                indent=2,
-                default=json_serializer
-            )
+        if ujson is not None:
+            def encode(record):
+                return ujson.dumps(record, default=json_serializer).encode()
+        else:
+            stdlib_encode = json.JSONEncoder(default=json_serializer).encode
+
+            def encode(record):
+                return stdlib_encode(record).encode()
+        return encode
+
+    def output_path(self, *parts):
+        """Resolve a path under ../generated/, creating directories as needed"""
+        # Get the directory where the script is running from
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        generated_dir = os.path.join(
+            os.path.dirname(script_dir),
+            'generated'
+        )
+
+        # Ensure generated directory exists
+        output_file = os.path.join(generated_dir, *parts)
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        return output_file
+
+    def save_collection(self, data, collection):
+        """Save a collection in the configured output format
+
+        Prints nothing, so it is safe to run on the background writer
+        thread. Returns the number of records written.
+        """
+        if self.output_format == 'bson':
+            return self.save_bson(data, collection)
+        return self.save_data(data, f"{collection}.json")
+
+    def save_bson(self, data, collection):
+        """Stream records to a mongorestore-ready BSON file
+
+        Files land in ../generated/<database>/<collection>.bson with real
+        ObjectIds and dates, so mongorestore loads them without re-parsing.
+        """
+        output_file = self.output_path(BSON_DATABASE, f"{collection}.bson")
+        encode = bson.encode
+
+        count = 0
+        with open(output_file, 'wb') as f:
+            for record in data:
+                # Copy so records reused by later stages keep their string ids
+                document = dict(record)
+                for field in OBJECT_ID_FIELDS:
+                    value = document.get(field)
+                    if value is not None:
+                        document[field] = ObjectId(value)
+                f.write(encode(document))
+                count += 1
+
+        return count
 
-        print(f"✅ Saved {len(data)} records to {output_file}")
+    def save_data(self, data, filename):
+        """Stream generated records to a JSON array file
+
+        Accepts any iterable so that collections nothing else depends on can
+        be written as they are generated. Returns the number of records.
+        """
+        output_file = self.output_path(filename)
+
+        encode = self.record_encoder()
+
+        count = 0
+        with open(output_file, 'wb') as f:
+            f.write(b'[')
+            for record in data:
+                f.write(b',\n' if count else b'\n')
+                f.write(encode(record))
+                count += 1
+            f.write(b'\n]\n')
+
+        return count
 
     def generate_all(self):
         """Generate complete dataset"""
         print("🚀 Starting complete data generation...")
 
-        # Generate in dependency order
-        categories = self.generate_categories()
-        self.save_data(categories, "categories.json")
+        # One seed per stage so each worker draws an independent stream
+        seeds = np.random.SeedSequence(self.seed).generate_state(7).tolist()
+
+        # A single background thread writes finished collections to disk
+        # while the next stage is being generated
+        io = ThreadPoolExecutor(max_workers=1)
+        writes = []
+
+        def write_later(records, collection):
+            writes.append(
+                (collection, io.submit(self.save_collection, records, collection))
+            )
+
+        with multiprocessing.Pool(processes=3) as pool, io:
+            # Categories, users and instructors do not depend on each other
+            categories_job = pool.apply_async(
+                run_stage, (self, 'generate_categories', seeds[0])
+            )
+            users_job = pool.apply_async(
+                run_stage, (self, 'generate_users', seeds[1])
+            )
+            instructors_job = pool.apply_async(
+                run_stage, (self, 'generate_instructors', seeds[2])
+            )
+
+            categories = categories_job.get()
+            write_later(categories, "categories")
 
-        users = self.generate_users()
-        self.save_data(users, "users.json")
+            users = users_job.get()
+            write_later(users, "users")
 
-        instructors = self.generate_instructors()
-        self.save_data(instructors, "instructors.json")
+            instructors = instructors_job.get()
+            write_later(instructors, "instructors")
 
-        courses = self.generate_courses(instructors, categories)
-        self.save_data(courses, "courses.json")
+            courses = run_stage(
+                self, 'generate_courses', seeds[3], instructors, categories
+            )
+            write_later(courses, "courses")
+
+            # Analytics events only need users and courses; the worker writes
+            # them itself so the records are never pickled back
+            events_job = pool.apply_async(
+                run_stage,
+                (self, 'generate_analytics_events', seeds[6], users, courses),
+                {'save_as': "analytics_events"}
+            )
 
-        enrollments = self.generate_enrollments(users, courses)
-        self.save_data(enrollments, "enrollments.json")
+            enrollments = run_stage(
+                self, 'generate_enrollments', seeds[4], users, courses
+            )
+            write_later(enrollments, "enrollments")
 
-        reviews = self.generate_reviews(enrollments)
-        self.save_data(reviews, "reviews.json")
+            # Reviews feed no later stage, so they are streamed to disk
+            review_count = run_stage(
+                self, 'generate_reviews', seeds[5], enrollments,
+                save_as="reviews"
+            )
+            event_count = events_job.get()
 
-        analytics_events = self.generate_analytics_events(users, courses)
-        self.save_data(analytics_events, "analytics_events.json")
+            # Report background writes from this thread so their output
+            # never interleaves with stage progress; also surfaces errors
+            for collection, write in writes:
+                print(f"✅ Saved {write.result()} {collection} records")
 
         print(f"🎉 Data generation complete! Generated {self.mode} dataset.")
         print("📁 Files saved to: ../generated/")
@@ -547,12 +909,12 @@ class MongoDataGenerator:
                 "instructors": len(instructors),
                 "courses": len(courses),
                 "enrollments": len(enrollments),
-                "reviews": len(reviews),
-                "analytics_events": len(analytics_events)
+                "reviews": review_count,
+                "analytics_events": event_count
             },
             "total_records": sum([
                 len(categories), len(users), len(instructors),
-                len(courses), len(enrollments), len(reviews), len(analytics_events)
+                len(courses), len(enrollments), review_count, event_count
             ])
         }
 
@@ -561,6 +923,24 @@ class MongoDataGenerator:
               "generation_summary.json")
 
 
+def run_stage(generator, stage, seed, *args, save_as=None):
+    """Run one generate_* stage with its own seed (also the pool entry point)
+
+    When save_as names a collection the records are written out where they
+    were generated and only the record count is returned.
+    """
+    generator.rng.seed(seed)
+    generator.np_rng = np.random.default_rng(seed)
+    fake.seed_instance(seed)
+
+    records = getattr(generator, stage)(*args)
+    if save_as:
+        count = generator.save_collection(records, save_as)
+        print(f"✅ Saved {count} {save_as} records")
+        return count
+    return records
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='MongoDB data generator for MongoMasterPro'
@@ -580,10 +960,24 @@ def main():
         default='all',
         help='Generate specific collection or all'
     )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Seed for reproducible datasets (ids are always unique)'
+    )
+    parser.add_argument(
+        '--format',
+        choices=['json', 'bson'],
+        default='json',
+        help='Output format: json (mongoimport --jsonArray) or bson (mongorestore)'
+    )
 
     args = parser.parse_args()
 
-    generator = MongoDataGenerator(mode=args.mode)
+    generator = MongoDataGenerator(
+        mode=args.mode, seed=args.seed, output_format=args.format
+    )
 
     if args.collection == 'all':
         generator.generate_all()
@@ -0,0 +1,64 @@
+# Location: `/tests/unit/test_generate_data.py`
+# Unit tests for the Python data generator helpers
+
+import os
+import sys
+
+import pytest
+from faker.providers.date_time import Provider as DateTimeProvider
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'generators')
+)
+
+import generate_data  # noqa: E402
+from generate_data import MongoDataGenerator, run_stage  # noqa: E402
+
+NOW_TS = 1_700_000_000
+
+
+@pytest.fixture(scope='module')
+def generator():
+    return MongoDataGenerator(mode='lite', seed=1)
+
+
+@pytest.mark.parametrize(
+    'spec', ['-2y', '-3y', '-6M', '-3M', '-1w', '-30d', '-7d', '-2h', '-6m', '-45s']
+)
+def test_relative_timestamp_matches_faker(generator, spec):
+    expected = NOW_TS + int(DateTimeProvider._parse_timedelta(spec))
+    assert generator.relative_timestamp(spec, NOW_TS) == expected
+
+
+def test_relative_timestamp_minutes_and_months(generator):
+    assert generator.relative_timestamp('-5m', NOW_TS) == NOW_TS - 300
+    assert generator.relative_timestamp('-1M', NOW_TS) == NOW_TS - int(30.42 * 86400)
+    assert generator.relative_timestamp('now', NOW_TS) == NOW_TS
+
+
+def test_relative_timestamp_rejects_unknown_spec(generator):
+    with pytest.raises(ValueError):
+        generator.relative_timestamp('-3q', NOW_TS)
+
+
+def seeded_review_ratings(generator, monkeypatch, now_ts):
+    monkeypatch.setattr(generate_data.time, 'time', lambda: now_ts)
+    statuses = ('completed', 'in_progress', 'not_started')
+    enrollments = [
+        {
+            "user_id": f"user{i}",
+            "course_id": f"course{i % 7}",
+            "completion_status": statuses[i % 3],
+            "enrolled_at": f"2023-{i % 12 + 1:02d}-{i % 28 + 1:02d}T08:30:00"
+        }
+        for i in range(300)
+    ]
+    reviews = run_stage(generator, 'generate_reviews', 11, enrollments)
+    return [(r['user_id'], r['rating']) for r in reviews]
+
+
+def test_generate_reviews_is_seeded_regardless_of_clock(generator, monkeypatch):
+    first = seeded_review_ratings(generator, monkeypatch, NOW_TS)
+    later = seeded_review_ratings(generator, monkeypatch, NOW_TS + 86_413)
+    assert first == later